@@ -0,0 +1,44 @@
+"""Added GIN indexes for full-text search
+
+Revision ID: b0c5f74c99fa
+Revises: edfdea225579
+Create Date: 2022-06-10 10:15:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b0c5f74c99fa"
+down_revision = "edfdea225579"
+branch_labels = None
+depends_on = None
+
+# Expressions must match the document built by ``storage.search_clause`` exactly so that the planner can
+# answer the ``@@`` predicate from the index.
+SEARCH_DOCUMENTS = {
+    "applications": (
+        "coalesce(application_name, '') || ' ' || coalesce(application_identifier, '') || ' ' || "
+        "coalesce(application_description, '') || ' ' || coalesce(application_owner_email, '')"
+    ),
+    "job_scripts": (
+        "coalesce(job_script_name, '') || ' ' || coalesce(job_script_description, '') || ' ' || "
+        "coalesce(job_script_owner_email, '')"
+    ),
+    "job_submissions": (
+        "coalesce(job_submission_name, '') || ' ' || coalesce(job_submission_description, '') || ' ' || "
+        "coalesce(job_submission_owner_email, '') || ' ' || coalesce(cluster_id, '')"
+    ),
+}
+
+
+def upgrade():
+    for (table, document) in SEARCH_DOCUMENTS.items():
+        op.execute(
+            f"CREATE INDEX ix_{table}_search "
+            f"ON {table} USING GIN (to_tsvector('simple', {document}))"
+        )
+
+
+def downgrade():
+    for table in SEARCH_DOCUMENTS:
+        op.execute(f"DROP INDEX ix_{table}_search")
@@ -5,7 +5,7 @@ from datetime import datetime
 from textwrap import dedent
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from jobbergate_api.meta_mapper import MetaField, MetaMapper
 
@@ -126,8 +126,8 @@ class ApplicationResponse(BaseModel):
     """
 
     id: Optional[int]
-    created_at: Optional[datetime] = datetime.utcnow()
-    updated_at: Optional[datetime] = datetime.utcnow()
+    created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
+    updated_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
     application_name: str
     application_identifier: Optional[str]
     application_description: Optional[str]
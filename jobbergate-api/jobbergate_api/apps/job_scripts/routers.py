@@ -1,21 +1,28 @@
 """
 Router for the JobScript resource.
 """
-import json
+import asyncio
 import tarfile
-import tempfile
-from io import BytesIO, StringIO
+from copy import deepcopy
+from functools import lru_cache
 from typing import List, Optional
 
+import orjson
 from armasec import TokenPayload
 from botocore.exceptions import BotoCoreError
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from jinja2 import Template
+from fastapi.concurrency import run_in_threadpool
+from jinja2 import Environment, Template
 from loguru import logger
-from yaml import safe_load
+from sqlalchemy import bindparam
+from yaml import load as yaml_load
+
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
 
 from jobbergate_api.apps.applications.models import applications_table
-from jobbergate_api.apps.applications.schemas import ApplicationResponse
 from jobbergate_api.apps.job_scripts.models import job_scripts_table, searchable_fields, sortable_fields
 from jobbergate_api.apps.job_scripts.schemas import (
     JobScriptCreateRequest,
@@ -30,6 +37,49 @@ from jobbergate_api.storage import INTEGRITY_CHECK_EXCEPTIONS, database, search_
 
 router = APIRouter()
 s3man = S3Manager()
+template_env = Environment(autoescape=False, auto_reload=False)
+
+# Query shapes for the hot endpoints, built once per process instead of per request. The SQL they compile
+# to is stable, so asyncpg's per-connection prepared-statement cache reuses the server-side plan as well.
+application_by_id_query = applications_table.select().where(
+    applications_table.c.id == bindparam("application_id")
+)
+job_script_by_id_query = job_scripts_table.select().where(
+    job_scripts_table.c.id == bindparam("job_script_id")
+)
+
+
+@lru_cache(maxsize=1024)
+def compile_template(template_source: str) -> Template:
+    """
+    Compile a template source string into a jinja2 Template, caching by the source text.
+
+    Standalone ``Template(...)`` calls build a throw-away ``Environment`` (lexer, parser, and code
+    generator) per call. Compiling through a shared module-level environment and memoizing the result means
+    repeated renders of the same template only pay for bytecode execution.
+    """
+    return template_env.from_string(template_source)
+
+
+@lru_cache(maxsize=2048)
+def _parse_application_config(application_config: str) -> dict:
+    """
+    Parse an application_config YAML string into a dict, caching by the config text.
+
+    The cached dict must never be mutated by callers. Use ``get_application_config_params`` to get a copy
+    that is safe to modify.
+    """
+    return yaml_load(application_config, Loader=YamlSafeLoader)
+
+
+def get_application_config_params(application_config: str) -> dict:
+    """
+    Return a mutation-safe copy of the param dict parsed from an application_config YAML string.
+
+    Application configs rarely change between job_script creations, so the parsed dict is served from an
+    LRU cache keyed by the config text and deep-copied on the way out.
+    """
+    return deepcopy(_parse_application_config(application_config))
 
 
 def inject_sbatch_params(job_script_data_as_string: str, sbatch_params: List[str]) -> str:
@@ -45,9 +95,8 @@ def inject_sbatch_params(job_script_data_as_string: str, sbatch_params: List[str
     string_slice = job_script_data_as_string[first_sbatch_index:]
     line_end = string_slice.find("\n") + first_sbatch_index + 1
 
-    inner_string = ""
-    for parameter in sbatch_params:
-        inner_string += "#SBATCH " + parameter + "\\n"
+    # The params are spliced into a json-encoded payload, so the two-character "\\n" sequence is correct
+    inner_string = "".join("#SBATCH " + parameter + "\\n" for parameter in sbatch_params)
 
     new_job_script_data_as_string = (
         job_script_data_as_string[:line_end] + inner_string + job_script_data_as_string[line_end:]
@@ -66,19 +115,30 @@ def get_s3_object_as_tarfile(application_id):
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Application with id={application_id} not found in S3",
         )
-    s3_application_tar = tarfile.open(fileobj=BytesIO(s3_application_obj["Body"].read()))
+    s3_application_tar = tarfile.open(fileobj=s3_application_obj["Body"], mode="r|gz")
     return s3_application_tar
 
 
+def is_static_template(template_source: str) -> bool:
+    """
+    Check if a template source contains no jinja2 constructs and would render to itself.
+    """
+    return "{{" not in template_source and "{%" not in template_source and "{#" not in template_source
+
+
 def render_template(template_files, param_dict_flat):
     """
     Render the templates as strings using jinja2.
+
+    Files without any jinja2 constructs skip compilation and rendering entirely.
     """
     for key, value in template_files.items():
-        template = Template(value)
+        if is_static_template(value):
+            continue
+        template = compile_template(value)
         rendered_js = template.render(data=param_dict_flat)
         template_files[key] = rendered_js
-    job_script_data_as_string = json.dumps(template_files)
+    job_script_data_as_string = orjson.dumps(template_files).decode("utf-8")
     return job_script_data_as_string
 
 
@@ -89,47 +149,35 @@ def build_job_script_data_as_string(s3_application_tar, param_dict):
     support_files_output = param_dict["jobbergate_config"].get("supporting_files_output_name")
     if support_files_output is None:
         support_files_output = dict()
+    output_name_by_file = {name: outputs[0] for (name, outputs) in support_files_output.items()}
 
-    supporting_files = param_dict["jobbergate_config"].get("supporting_files")
-    if supporting_files is None:
-        supporting_files = list()
+    supporting_files = frozenset(param_dict["jobbergate_config"].get("supporting_files") or ())
 
-    default_template = [
-        default_template := param_dict["jobbergate_config"].get("default_template"),
-        "templates/" + default_template,
-    ]
+    default_template = param_dict["jobbergate_config"].get("default_template")
+    default_template_names = frozenset((default_template, "templates/" + default_template))
 
     template_files = {}
-    for member in s3_application_tar.getmembers():
-        if member.name in default_template:
-            contentfobj = s3_application_tar.extractfile(member)
-            template_files["application.sh"] = contentfobj.read().decode("utf-8")
-        if member.name in supporting_files:
-            match = [x for x in support_files_output if member.name in x]
-            contentfobj = s3_application_tar.extractfile(member)
-            filename = support_files_output[match[0]][0]
-            template_files[filename] = contentfobj.read().decode("utf-8")
-
-    # Use tempfile to generate .tar in memory - NOT write to disk
+    extractfile = s3_application_tar.extractfile
+    for member in s3_application_tar:
+        is_default_template = member.name in default_template_names
+        is_supporting_file = member.name in supporting_files
+        if not is_default_template and not is_supporting_file:
+            continue
+        # Passing the known member size lets read() allocate the buffer once instead of growing it
+        content = extractfile(member).read(member.size).decode("utf-8")
+        if is_default_template:
+            template_files["application.sh"] = content
+        if is_supporting_file:
+            template_files[output_name_by_file[member.name]] = content
+
+    # Only flatten the param dict if some template will actually be rendered with it
     param_dict_flat = {}
-    for (key, value) in param_dict.items():
-        if isinstance(value, dict):
-            for nest_key, nest_value in value.items():
-                param_dict_flat[nest_key] = nest_value
-        else:
-            param_dict_flat[key] = value
-    with tempfile.NamedTemporaryFile("wb", suffix=".tar.gz", delete=False) as f:
-        with tarfile.open(fileobj=f, mode="w:gz") as rendered_tar:
-            for member in s3_application_tar.getmembers():
-                if member.name in supporting_files:
-                    contentfobj = s3_application_tar.extractfile(member)
-                    supporting_file = contentfobj.read().decode("utf-8")
-                    template = Template(supporting_file)
-                    rendered_str = template.render(data=param_dict_flat)
-                    tarinfo = tarfile.TarInfo(member.name)
-                    rendered_tar.addfile(tarinfo, StringIO(rendered_str))
-        f.flush()
-        f.seek(0)
+    if not all(is_static_template(content) for content in template_files.values()):
+        for (key, value) in param_dict.items():
+            if type(value) is dict:
+                param_dict_flat.update(value)
+            else:
+                param_dict_flat[key] = value
 
     job_script_data_as_string = render_template(template_files, param_dict_flat)
     return job_script_data_as_string
@@ -151,17 +199,29 @@ async def job_script_create(
     Make a post request to this endpoint with the required values to create a new job script.
     """
     logger.debug(f"Creating job_script with: {job_script}")
-    select_query = applications_table.select().where(applications_table.c.id == job_script.application_id)
-    raw_application = await database.fetch_one(select_query)
-
+    select_query = application_by_id_query.params(application_id=job_script.application_id)
+
+    # The S3 key only depends on the application id carried by the request, so the tarfile fetch can
+    # overlap the database round-trip. The speculative S3 result is discarded if the row is missing.
+    logger.debug("Fetching application row and tarfile concurrently")
+    (raw_application, s3_application_tar) = await asyncio.gather(
+        database.fetch_one(select_query),
+        run_in_threadpool(get_s3_object_as_tarfile, job_script.application_id),
+        return_exceptions=True,
+    )
+    if isinstance(raw_application, Exception):
+        raise raw_application
     if not raw_application:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Application with id={job_script.application_id} not found.",
         )
-    application = ApplicationResponse.parse_obj(raw_application)
-    logger.debug("Fetching application tarfile")
-    s3_application_tar = get_s3_object_as_tarfile(application.id)
+    if isinstance(s3_application_tar, Exception):
+        raise s3_application_tar
+
+    # Skip the ApplicationResponse round-trip; only the id and config are needed and the row came from
+    # the database, so there is nothing for pydantic to validate
+    application_config = raw_application["application_config"]
 
     identity_claims = IdentityClaims.from_token_payload(token_payload)
 
@@ -171,14 +231,16 @@ async def job_script_create(
     )
 
     # Use application_config from the application as a baseline of defaults
-    print("APP CONFIG: ", application.application_config)
-    param_dict = safe_load(application.application_config)
+    param_dict = get_application_config_params(application_config)
 
     # User supplied param dict is optional and may override defaults
     param_dict.update(**job_script.param_dict)
 
     logger.debug("Rendering job_script data as string")
-    job_script_data_as_string = build_job_script_data_as_string(s3_application_tar, param_dict)
+    # Tar extraction (gzip decode) and template rendering are pure CPU work; keep them off the event loop
+    job_script_data_as_string = await run_in_threadpool(
+        build_job_script_data_as_string, s3_application_tar, param_dict
+    )
 
     sbatch_params = create_dict.pop("sbatch_params", [])
     create_dict["job_script_data_as_string"] = inject_sbatch_params(job_script_data_as_string, sbatch_params)
@@ -205,7 +267,7 @@ async def job_script_get(job_script_id: int = Query(...)):
     """
     Return the job_script given its id.
     """
-    query = job_scripts_table.select().where(job_scripts_table.c.id == job_script_id)
+    query = job_script_by_id_query.params(job_script_id=job_script_id)
     job_script = await database.fetch_one(query)
 
     if not job_script:
@@ -259,19 +321,18 @@ async def job_script_delete(job_script_id: int = Query(..., description="id of t
     """
     Delete job_script given its id.
     """
-    where_stmt = job_scripts_table.c.id == job_script_id
-
-    get_query = job_scripts_table.select().where(where_stmt)
-    raw_job_script = await database.fetch_one(get_query)
-    if not raw_job_script:
+    delete_query = (
+        job_scripts_table.delete()
+        .where(job_scripts_table.c.id == job_script_id)
+        .returning(job_scripts_table.c.id)
+    )
+    deleted = await database.fetch_one(delete_query)
+    if deleted is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"JobScript with id={job_script_id} not found.",
         )
 
-    delete_query = job_scripts_table.delete().where(where_stmt)
-    await database.execute(delete_query)
-
 
 @router.put(
     "/job-scripts/{job_script_id}",
@@ -76,6 +76,9 @@ class Settings(BaseSettings):
     # Maximum number of bytes allowed for file uploads
     MAX_UPLOAD_FILE_SIZE: int = 100 * 1024 * 1024  # 100 MB
 
+    # Use PostgreSQL full-text search (requires the GIN indexes from the migrations) for list endpoints
+    USE_FULL_TEXT_SEARCH: bool = Field(False)
+
     @root_validator(pre=True)
     def remove_blank_env(cls, values):
         """
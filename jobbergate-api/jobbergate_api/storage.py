@@ -3,6 +3,7 @@ Provide functions to interact with persistent data storage.
 """
 import re
 import typing
+from urllib.parse import quote
 
 import asyncpg
 import databases
@@ -14,14 +15,18 @@ from asyncpg.exceptions import UniqueViolationError
 from fastapi.exceptions import HTTPException
 from loguru import logger
 from sqlalchemy import Column, or_
-from sqlalchemy.sql.expression import BooleanClauseList, UnaryExpression
+from sqlalchemy.sql.expression import UnaryExpression
 from starlette import status
-from yarl import URL
 
 from jobbergate_api.config import DeployEnvEnum, settings
 
 INTEGRITY_CHECK_EXCEPTIONS = (UniqueViolationError,)
 
+FK_DETAIL_RX = re.compile(
+    r"DETAIL:  Key \(id\)=\((?P<pk_id>\d+)\) is still referenced from table \"(?P<table>\w+)\"",
+    re.MULTILINE,
+)
+
 
 def build_db_url(force_test: bool = False) -> str:
     """
@@ -33,16 +38,13 @@ def build_db_url(force_test: bool = False) -> str:
     is_test = force_test or settings.DEPLOY_ENV == DeployEnvEnum.TEST
     prefix = "TEST_" if is_test else ""
 
-    return str(
-        URL.build(
-            scheme="postgresql",
-            user=getattr(settings, f"{prefix}DATABASE_USER"),
-            password=getattr(settings, f"{prefix}DATABASE_PSWD"),
-            host=getattr(settings, f"{prefix}DATABASE_HOST"),
-            port=getattr(settings, f"{prefix}DATABASE_PORT"),
-            path="/{}".format(getattr(settings, f"{prefix}DATABASE_NAME")),
-        )
-    )
+    user = quote(getattr(settings, f"{prefix}DATABASE_USER"), safe="")
+    pswd = quote(getattr(settings, f"{prefix}DATABASE_PSWD"), safe="")
+    host = getattr(settings, f"{prefix}DATABASE_HOST")
+    port = getattr(settings, f"{prefix}DATABASE_PORT")
+    name = getattr(settings, f"{prefix}DATABASE_NAME")
+
+    return f"postgresql://{user}:{pswd}@{host}:{port}/{name}"
 
 
 database = databases.Database(build_db_url(), force_rollback=settings.DEPLOY_ENV == DeployEnvEnum.TEST)
@@ -58,10 +60,21 @@ def render_sql(query) -> str:
 def search_clause(
     search_terms: str,
     searchable_fields: typing.List[Column],
-) -> BooleanClauseList:
+):
     """
     Create search clause across searchable fields with search terms.
+
+    If the ``USE_FULL_TEXT_SEARCH`` setting is enabled, build a single full-text ``@@`` predicate that can
+    be answered from the GIN indexes created by the migrations. Otherwise, fall back to an ``ilike``
+    OR-chain across all searchable fields, which forces a sequential scan with a per-row substring match
+    for every (term, field) pair.
     """
+    if settings.USE_FULL_TEXT_SEARCH:
+        document = sqlalchemy.func.coalesce(searchable_fields[0], "")
+        for field in searchable_fields[1:]:
+            document = document + " " + sqlalchemy.func.coalesce(field, "")
+        tsvector = sqlalchemy.func.to_tsvector("simple", document)
+        return tsvector.op("@@")(sqlalchemy.func.plainto_tsquery("simple", search_terms))
     return or_(*[field.ilike(f"%{term}%") for field in searchable_fields for term in search_terms.split()])
 
 
@@ -94,8 +107,7 @@ def handle_fk_error(
     """
     Unpack metadata from a ForeignKeyViolationError and return a 409 response.
     """
-    FK_DETAIL_RX = r"DETAIL:  Key \(id\)=\((?P<pk_id>\d+)\) is still referenced from table \"(?P<table>\w+)\""
-    matches = re.search(FK_DETAIL_RX, str(err), re.MULTILINE)
+    matches = FK_DETAIL_RX.search(str(err))
     (table, pk_id) = (None, None)
     if matches:
         table = matches.group("table")
@@ -1,3 +1,12 @@
 """
 Provide unit tests for the API.
 """
+import os
+
+# Give each pytest-xdist worker its own test database so the suite can run in parallel.
+# This runs before any jobbergate_api module reads the settings, so the suffixed name is what
+# build_db_url() and the shared database object pick up.
+_xdist_worker = os.environ.get("PYTEST_XDIST_WORKER")
+if _xdist_worker:
+    _base_name = os.environ.get("TEST_DATABASE_NAME", "test-db")
+    os.environ["TEST_DATABASE_NAME"] = f"{_base_name}-{_xdist_worker}"
@@ -3,9 +3,157 @@ Convenience fixtures for the job scripts tests.
 """
 import tarfile
 from io import BytesIO
+from unittest import mock
 
+import sqlalchemy
 from pytest import fixture
 
+from jobbergate_api.apps.applications.models import applications_table
+from jobbergate_api.apps.job_scripts.models import job_scripts_table
+from jobbergate_api.apps.job_scripts.routers import s3man
+from jobbergate_api.storage import database
+
+
+@fixture(autouse=True)
+async def rollback_transaction(startup_event_force):
+    """
+    Wrap each test in a transaction that is rolled back when the test finishes.
+
+    The force_rollback connection established by the app lifespan already holds the outer transaction, so
+    each test only costs a SAVEPOINT/ROLLBACK TO round-trip instead of a per-test decorator spelling out a
+    full transaction on every function.
+    """
+    async with database.transaction(force_rollback=True):
+        yield
+
+
+@fixture(autouse=True)
+def s3_client_mock():
+    """
+    Replace the s3 client on the shared S3Manager with a fresh mock for every test in this package.
+
+    Swapping the attribute directly skips the patch/unpatch chain walking that mock.patch.object repeats
+    when each test installs its own context manager.
+
+    The mock is deliberately synchronous: S3Manager wraps the sync boto3 client, and the router offloads
+    its calls with run_in_threadpool rather than using an async s3 client.
+    """
+    original = s3man.s3_client
+    s3man.s3_client = mock.MagicMock()
+    yield s3man.s3_client
+    s3man.s3_client = original
+
+
+@fixture
+async def seeded_application(fill_application_data):
+    """
+    Provide a fixture that seeds the application row most tests hang their job_scripts on.
+
+    Returns the id of an application owned by ``owner1@org.com``. The row lives inside the per-test
+    savepoint, so the fixture stays function-scoped; it exists to share the insert boilerplate, not the row.
+    """
+    return await database.execute(
+        query=applications_table.insert(),
+        values=fill_application_data(application_owner_email="owner1@org.com"),
+    )
+
+
+@fixture
+def bulk_insert():
+    """
+    Provide a fixture that seeds many rows through one multi-row INSERT statement.
+
+    A single ``INSERT ... VALUES (...), (...) RETURNING id`` costs one round-trip where ``execute_many``
+    pays a bind/execute pair per row, and the returned ids double as the seed verification so callers
+    don't need a follow-up ``COUNT(*)`` probe.
+    """
+
+    async def _helper(table, rows):
+        id_rows = await database.fetch_all(query=table.insert().values(rows).returning(table.c.id))
+        assert len(id_rows) == len(rows)
+        return [row[0] for row in id_rows]
+
+    return _helper
+
+
+@fixture
+def insert_app_and_js(fill_application_data, fill_job_script_data):
+    """
+    Provide a fixture that seeds an application and a dependent job_script in one round-trip.
+
+    The FK forces the insert order, but not two separate statements: a ``WITH app AS (INSERT ...
+    RETURNING id)`` CTE feeds the application id straight into the job_scripts insert, so the pair
+    costs a single round-trip. Returns ``(application_id, job_script_id)``; the RETURNING clause
+    already proves both rows exist, so callers don't need a follow-up ``COUNT(*)`` probe.
+    """
+
+    async def _helper(app_vals=None, js_vals=None):
+        app_vals = app_vals or fill_application_data(application_owner_email="owner1@org.com")
+        js_vals = js_vals or fill_job_script_data()
+        app_cte = applications_table.insert().values(app_vals).returning(applications_table.c.id).cte("app")
+        query = (
+            job_scripts_table.insert()
+            .from_select(
+                list(js_vals.keys()) + ["application_id"],
+                sqlalchemy.select([sqlalchemy.literal(value) for value in js_vals.values()] + [app_cte.c.id]),
+            )
+            .returning(job_scripts_table.c.id, job_scripts_table.c.application_id)
+        )
+        row = await database.fetch_one(query)
+        return row["application_id"], row["id"]
+
+    return _helper
+
+
+@fixture
+async def seeded_job_script(insert_app_and_js):
+    """
+    Provide a fixture that seeds one job_script (and the application it hangs on) and returns its id.
+
+    Tests that also need the application id should call ``insert_app_and_js`` directly instead.
+    """
+    _, job_script_id = await insert_app_and_js()
+    return job_script_id
+
+
+@fixture
+def row_exists():
+    """
+    Provide a fixture that checks whether a row with the given primary key exists.
+
+    ``SELECT EXISTS(SELECT 1 ... WHERE id = :pk)`` stops at the first index hit and ships one boolean
+    over the wire, where a ``SELECT COUNT(*)`` scans the whole table to answer the same question.
+    """
+
+    async def _helper(table, pk):
+        return await database.fetch_val(sqlalchemy.select([sqlalchemy.exists().where(table.c.id == pk)]))
+
+    return _helper
+
+
+@fixture
+def seed_application_with_scripts(fill_application_data, bulk_insert):
+    """
+    Provide a fixture that seeds an application and its job_scripts as one atomic batch.
+
+    Stamps the new application id onto every row and runs both inserts inside a single nested
+    transaction, so the whole seed phase is finalized in one shot. Returns the application id.
+    """
+
+    async def _helper(script_rows, owner_email="owner1@org.com"):
+        async with database.transaction():
+            application_id = await database.execute(
+                query=applications_table.insert(),
+                values=fill_application_data(application_owner_email=owner_email),
+            )
+            await bulk_insert(
+                job_scripts_table,
+                [{"application_id": application_id, **row} for row in script_rows],
+            )
+        return application_id
+
+    return _helper
+
 
 @fixture
 def param_dict():
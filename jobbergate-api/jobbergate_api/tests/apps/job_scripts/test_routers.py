@@ -1,53 +1,77 @@
 """
 Tests for the /job-scripts/ endpoint.
 """
+import asyncio
 import json
+from datetime import datetime, timedelta
 from textwrap import dedent
 from unittest import mock
 
-import asyncpg
 import pytest
 from botocore.exceptions import BotoCoreError
 from fastapi import status
 from fastapi.exceptions import HTTPException
 
-from jobbergate_api.apps.applications.models import applications_table
 from jobbergate_api.apps.job_scripts.models import job_scripts_table
 from jobbergate_api.apps.job_scripts.routers import (
     build_job_script_data_as_string,
     get_s3_object_as_tarfile,
     inject_sbatch_params,
     render_template,
-    s3man,
 )
-from jobbergate_api.apps.job_scripts.schemas import JobScriptResponse
 from jobbergate_api.apps.permissions import Permissions
 from jobbergate_api.storage import database
 
+# Static payloads computed once at import time so the fixtures below don't redo the
+# dedent/json.dumps work for every consuming test.
+JOB_SCRIPT_DICT = {
+    "application.sh": dedent(
+        """
+        #!/bin/bash
+
+        #SBATCH --job-name=rats
+        #SBATCH --partition=debug
+        #SBATCH --output=sample-%j.out
+
+
+        echo $SLURM_TASKS_PER_NODE
+        echo $SLURM_SUBMIT_DIR
+        """
+    ).strip(),
+}
+
+JOB_SCRIPT_DATA_AS_STRING = json.dumps(JOB_SCRIPT_DICT)
+
+NEW_JOB_SCRIPT_DATA_AS_STRING = json.dumps(
+    {
+        "application.sh": dedent(
+            """
+            #!/bin/bash
+
+            #SBATCH --comment=some_comment
+            #SBATCH --nice=-1
+            #SBATCH -N 10
+            #SBATCH --job-name=rats
+            #SBATCH --partition=debug
+            #SBATCH --output=sample-%j.out
+
+
+            echo $SLURM_TASKS_PER_NODE
+            echo $SLURM_SUBMIT_DIR
+            """
+        ).strip(),
+    }
+)
+
+SBATCH_PARAMS = ["--comment=some_comment", "--nice=-1", "-N 10"]
+
 
 @pytest.fixture
 def job_script_data_as_string():
     """
     Provide a fixture that returns an example of a default application script.
     """
-    content = json.dumps(
-        {
-            "application.sh": dedent(
-                """
-                #!/bin/bash
-
-                #SBATCH --job-name=rats
-                #SBATCH --partition=debug
-                #SBATCH --output=sample-%j.out
-
-
-                echo $SLURM_TASKS_PER_NODE
-                echo $SLURM_SUBMIT_DIR
-                """
-            ).strip(),
-        }
-    )
-    return content
+    return JOB_SCRIPT_DATA_AS_STRING
 
 
 @pytest.fixture
@@ -55,27 +79,7 @@ def new_job_script_data_as_string():
     """
     Provide a fixture that returns an application script after the injection of the sbatch params.
     """
-    content = json.dumps(
-        {
-            "application.sh": dedent(
-                """
-                #!/bin/bash
-
-                #SBATCH --comment=some_comment
-                #SBATCH --nice=-1
-                #SBATCH -N 10
-                #SBATCH --job-name=rats
-                #SBATCH --partition=debug
-                #SBATCH --output=sample-%j.out
-
-
-                echo $SLURM_TASKS_PER_NODE
-                echo $SLURM_SUBMIT_DIR
-                """
-            ).strip(),
-        }
-    )
-    return content
+    return NEW_JOB_SCRIPT_DATA_AS_STRING
 
 
 @pytest.fixture
@@ -83,7 +87,7 @@ def sbatch_params():
     """
     Provide a fixture that returns string content of the argument --sbatch-params.
     """
-    return ["--comment=some_comment", "--nice=-1", "-N 10"]
+    return SBATCH_PARAMS
 
 
 def test_inject_sbatch_params(job_script_data_as_string, sbatch_params, new_job_script_data_as_string):
@@ -95,16 +99,15 @@ def test_inject_sbatch_params(job_script_data_as_string, sbatch_params, new_job_
 
 
 @pytest.mark.asyncio
-@database.transaction(force_rollback=True)
 async def test_create_job_script(
-    fill_application_data,
+    seeded_application,
     job_script_data,
     fill_job_script_data,
     param_dict,
     client,
     inject_security_header,
-    time_frame,
     s3_object,
+    s3_client_mock,
 ):
     """
     Test POST /job_scripts/ correctly creates a job_script.
@@ -113,113 +116,120 @@ async def test_create_job_script(
     endpoint. We show this by asserting that the job_script is created in the database after the post
     request is made, the correct status code (201) is returned.
     """
-    inserted_application_id = await database.execute(
-        query=applications_table.insert(),
-        values=fill_application_data(application_owner_email="owner1@org.com"),
-    )
+    inserted_application_id = seeded_application
 
     inject_security_header("owner1@org.com", Permissions.JOB_SCRIPTS_EDIT)
-    with time_frame() as window:
-        with mock.patch.object(s3man, "s3_client") as s3man_client_mock:
-            s3man_client_mock.get_object.return_value = s3_object
-            response = await client.post(
-                "/jobbergate/job-scripts/",
-                json=fill_job_script_data(
-                    application_id=inserted_application_id,
-                    param_dict=param_dict,
-                ),
-            )
+    s3_client_mock.get_object.return_value = s3_object
+    before = datetime.utcnow().replace(microsecond=0)
+    response = await client.post(
+        "/jobbergate/job-scripts/",
+        json=fill_job_script_data(
+            application_id=inserted_application_id,
+            param_dict=param_dict,
+        ),
+    )
+    after = datetime.utcnow() + timedelta(seconds=1)
 
     assert response.status_code == status.HTTP_201_CREATED
-    s3man_client_mock.get_object.assert_called_once()
+    s3_client_mock.get_object.assert_called_once()
 
     id_rows = await database.fetch_all("SELECT id FROM job_scripts")
     assert len(id_rows) == 1
 
-    job_script = JobScriptResponse(**response.json())
+    job_script = response.json()
 
-    assert job_script.id == id_rows[0][0]
-    assert job_script.job_script_name == job_script_data["job_script_name"]
-    assert job_script.job_script_owner_email == "owner1@org.com"
-    assert job_script.job_script_description is None
-    assert job_script.job_script_data_as_string
-    assert job_script.job_script_data_as_string != job_script_data["job_script_data_as_string"]
-    assert job_script.application_id == inserted_application_id
-    assert job_script.created_at in window
-    assert job_script.updated_at in window
+    assert job_script["id"] == id_rows[0][0]
+    assert job_script["job_script_name"] == job_script_data["job_script_name"]
+    assert job_script["job_script_owner_email"] == "owner1@org.com"
+    assert job_script["job_script_description"] is None
+    assert job_script["job_script_data_as_string"]
+    assert job_script["job_script_data_as_string"] != job_script_data["job_script_data_as_string"]
+    assert job_script["application_id"] == inserted_application_id
+    assert before <= datetime.fromisoformat(job_script["created_at"]) <= after
+    assert before <= datetime.fromisoformat(job_script["updated_at"]) <= after
 
 
 @pytest.mark.asyncio
-@database.transaction(force_rollback=True)
-async def test_create_job_script_bad_permission(
-    fill_application_data,
+@pytest.mark.parametrize(
+    "method,path,permission,application_id,expected_status",
+    [
+        ("POST", "/jobbergate/job-scripts/", "INVALID_PERMISSION", None, status.HTTP_403_FORBIDDEN),
+        ("POST", "/jobbergate/job-scripts/", Permissions.JOB_SCRIPTS_EDIT, 9999, status.HTTP_404_NOT_FOUND),
+        (
+            "GET",
+            "/jobbergate/job-scripts/9999",
+            Permissions.JOB_SCRIPTS_VIEW,
+            None,
+            status.HTTP_404_NOT_FOUND,
+        ),
+        (
+            "GET",
+            "/jobbergate/job-scripts/{job_script_id}",
+            "INVALID_PERMISSION",
+            None,
+            status.HTTP_403_FORBIDDEN,
+        ),
+        ("GET", "/jobbergate/job-scripts/", "INVALID_PERMISSION", None, status.HTTP_403_FORBIDDEN),
+        ("PUT", "/jobbergate/job-scripts/123", Permissions.JOB_SCRIPTS_EDIT, None, status.HTTP_404_NOT_FOUND),
+        (
+            "PUT",
+            "/jobbergate/job-scripts/{job_script_id}",
+            "INVALID_PERMISSION",
+            None,
+            status.HTTP_403_FORBIDDEN,
+        ),
+    ],
+)
+async def test_job_script_routes__rejected_requests(
+    method,
+    path,
+    permission,
+    application_id,
+    expected_status,
+    insert_app_and_js,
+    job_script_data,
     fill_job_script_data,
     param_dict,
     client,
     inject_security_header,
 ):
     """
-    Test that it is not possible to create job_script without proper permission.
+    Test that create, get and update requests are rejected when denied or aimed at a missing row.
 
-    This test proves that is not possible to create a job_script without the proper permission.
-    We show this by trying to create a job_script without a permission that allow "create" then assert
-    that the job_script still does not exists in the database, and the correct status code (403) is returned.
-    and that the boto3 method is never called.
+    This test proves that the job-script endpoints return the correct status code when the user lacks the
+    needed permission (403) or targets a job_script or application that does not exist (404). We show this
+    by seeding a single job_script, issuing each rejected request shape against it, and asserting that the
+    response carries the expected status code while the seeded row remains untouched.
     """
-    inserted_application_id = await database.execute(
-        query=applications_table.insert(),
-        values=fill_application_data(application_owner_email="owner1@org.com"),
-    )
+    seeded_application_id, seeded_job_script_id = await insert_app_and_js()
 
-    inject_security_header("owner1@org.com", "INVALID_PERMISSION")
-    response = await client.post(
-        "/jobbergate/job-scripts/",
-        json=fill_job_script_data(
-            application_id=inserted_application_id,
+    inject_security_header("owner1@org.com", permission)
+    kwargs = {}
+    if method == "POST":
+        kwargs["json"] = fill_job_script_data(
+            application_id=application_id or seeded_application_id,
             param_dict=param_dict,
-        ),
-    )
-
-    assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    count = await database.fetch_all("SELECT COUNT(*) FROM job_scripts")
-    assert count[0][0] == 0
-
-
-@pytest.mark.asyncio
-@database.transaction(force_rollback=True)
-async def test_create_job_script_without_application(
-    fill_job_script_data,
-    param_dict,
-    client,
-    inject_security_header,
-):
-    """
-    Test that is not possible to create a job_script without an application.
+        )
+    elif method == "PUT":
+        kwargs["json"] = {"job_script_name": "new name"}
+    response = await client.request(method, path.format(job_script_id=seeded_job_script_id), **kwargs)
 
-    This test proves that is not possible to create a job_script without an existing application.
-    We show this by trying to create a job_script without an application created before, then assert that the
-    job_script still does not exists in the database and the correct status code (404) is returned.
-    """
-    inject_security_header("owner1@org.com", Permissions.JOB_SCRIPTS_EDIT)
-    response = await client.post(
-        "/jobbergate/job-scripts/",
-        json=fill_job_script_data(application_id=9999, param_dict=param_dict),
-    )
-    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.status_code == expected_status
 
-    count = await database.fetch_all("SELECT COUNT(*) FROM job_scripts")
-    assert count[0][0] == 0
+    assert await database.fetch_val("SELECT COUNT(*) FROM job_scripts") == 1
+    query = job_scripts_table.select(job_scripts_table.c.id == seeded_job_script_id)
+    job_script_row = await database.fetch_one(query)
+    assert job_script_row["job_script_name"] == job_script_data["job_script_name"]
 
 
 @pytest.mark.asyncio
-@database.transaction(force_rollback=True)
 async def test_create_job_script_file_not_found(
-    fill_application_data,
+    seeded_application,
     fill_job_script_data,
     param_dict,
     client,
     inject_security_header,
+    s3_client_mock,
 ):
     """
     Test that is not possible to create a job_script if the application is in the database but not in S3.
@@ -230,50 +240,41 @@ async def test_create_job_script_file_not_found(
     is not in S3 (raises BotoCoreError), then assert that the job_script still does not exists in the
     database, the correct status code (404) is returned and that the boto3 method was called.
     """
-    inserted_application_id = await database.execute(
-        query=applications_table.insert(),
-        values=fill_application_data(application_owner_email="owner1@org.com"),
-    )
+    inserted_application_id = seeded_application
 
     inject_security_header("owner1@org.com", Permissions.JOB_SCRIPTS_EDIT)
-    with mock.patch.object(s3man, "s3_client") as s3man_client_mock:
-        s3man_client_mock.get_object.side_effect = BotoCoreError()
-        response = await client.post(
-            "/jobbergate/job-scripts/",
-            json=fill_job_script_data(
-                application_id=inserted_application_id,
-                param_dict=param_dict,
-            ),
-        )
+    s3_client_mock.get_object.side_effect = BotoCoreError()
+    response = await client.post(
+        "/jobbergate/job-scripts/",
+        json=fill_job_script_data(
+            application_id=inserted_application_id,
+            param_dict=param_dict,
+        ),
+    )
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
-    s3man_client_mock.get_object.assert_called_once()
+    s3_client_mock.get_object.assert_called_once()
 
-    count = await database.fetch_all("SELECT COUNT(*) FROM job_scripts")
-    assert count[0][0] == 0
+    assert await database.fetch_val("SELECT COUNT(*) FROM job_scripts") == 0
 
 
-@pytest.mark.asyncio
-@mock.patch.object(s3man, "s3_client")
-@database.transaction(force_rollback=True)
-async def test_get_s3_object_as_tarfile(s3man_client_mock, s3_object):
+def test_get_s3_object_as_tarfile(s3_client_mock, s3_object):
     """
     Test getting a file from S3 with get_s3_object function.
     """
-    s3man_client_mock.get_object.return_value = s3_object
+    s3_client_mock.get_object.return_value = s3_object
 
     s3_file = get_s3_object_as_tarfile(1)
 
     assert s3_file is not None
-    s3man_client_mock.get_object.assert_called_once()
+    s3_client_mock.get_object.assert_called_once()
 
 
-@mock.patch.object(s3man, "s3_client")
-def test_get_s3_object_not_found(s3man_client_mock):
+def test_get_s3_object_not_found(s3_client_mock):
     """
     Test exception when file not exists in S3 for get_s3_object function.
     """
-    s3man_client_mock.get_object.side_effect = BotoCoreError()
+    s3_client_mock.get_object.side_effect = BotoCoreError()
 
     s3_file = None
     with pytest.raises(HTTPException) as exc:
@@ -282,32 +283,30 @@ def test_get_s3_object_not_found(s3man_client_mock):
     assert "Application with id=1 not found" in str(exc)
 
     assert s3_file is None
-    s3man_client_mock.get_object.assert_called_once()
+    s3_client_mock.get_object.assert_called_once()
 
 
-def test_render_template(param_dict_flat, template_files, job_script_data_as_string):
+def test_render_template(param_dict_flat, template_files):
     """
     Test correctly rendered template for job_script template.
     """
     job_script_rendered = render_template(template_files, param_dict_flat)
-    assert json.loads(job_script_rendered) == json.loads(job_script_data_as_string)
+    assert json.loads(job_script_rendered) == JOB_SCRIPT_DICT
 
 
-def test_build_job_script_data_as_string(s3_object_as_tar, param_dict, job_script_data_as_string):
+def test_build_job_script_data_as_string(s3_object_as_tar, param_dict):
     """
     Test build_job_script_data_as_string function correct output.
     """
     data_as_string = build_job_script_data_as_string(s3_object_as_tar, param_dict)
-    assert json.loads(data_as_string) == json.loads(job_script_data_as_string)
+    assert json.loads(data_as_string) == JOB_SCRIPT_DICT
 
 
 @pytest.mark.asyncio
-@database.transaction(force_rollback=True)
 async def test_get_job_script_by_id(
     client,
-    fill_application_data,
+    insert_app_and_js,
     job_script_data,
-    fill_job_script_data,
     inject_security_header,
 ):
     """
@@ -318,79 +317,24 @@ async def test_get_job_script_by_id(
     returned in the response is equal to the job_script data that exists in the database
     for the given job_script id.
     """
-    inserted_application_id = await database.execute(
-        query=applications_table.insert(),
-        values=fill_application_data(application_owner_email="owner1@org.com"),
-    )
-    inserted_job_script_id = await database.execute(
-        query=job_scripts_table.insert(),
-        values=fill_job_script_data(application_id=inserted_application_id),
-    )
-
-    count = await database.fetch_all("SELECT COUNT(*) FROM job_scripts")
-    assert count[0][0] == 1
+    seeded_application_id, seeded_job_script_id = await insert_app_and_js()
 
     inject_security_header("owner1@org.com", Permissions.JOB_SCRIPTS_VIEW)
-    response = await client.get(f"/jobbergate/job-scripts/{inserted_job_script_id}")
+    response = await client.get(f"/jobbergate/job-scripts/{seeded_job_script_id}")
     assert response.status_code == status.HTTP_200_OK
 
     data = response.json()
-    assert data["id"] == inserted_job_script_id
+    assert data["id"] == seeded_job_script_id
     assert data["job_script_name"] == job_script_data["job_script_name"]
     assert data["job_script_data_as_string"] == job_script_data["job_script_data_as_string"]
     assert data["job_script_owner_email"] == "owner1@org.com"
-    assert data["application_id"] == inserted_application_id
+    assert data["application_id"] == seeded_application_id
 
 
 @pytest.mark.asyncio
-@database.transaction(force_rollback=True)
-async def test_get_job_script_by_id_invalid(client, inject_security_header):
-    """
-    Test the correct response code is returned when a job_script does not exist.
-
-    This test proves that GET /job-script/<id> returns the correct response code when the
-    requested job_script does not exist. We show this by asserting that the status code
-    returned is what we would expect given the job_script requested doesn't exist (404).
-    """
-    inject_security_header("owner1@org.com", Permissions.JOB_SCRIPTS_VIEW)
-    response = await client.get("/jobbergate/job-scripts/9999")
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-
-
-@pytest.mark.asyncio
-@database.transaction(force_rollback=True)
-async def test_get_job_script_by_id_bad_permission(
-    client,
-    fill_application_data,
-    fill_job_script_data,
-    inject_security_header,
-):
-    """
-    Test the correct response code is returned when the user don't have the proper permission.
-
-    This test proves that GET /job-script/<id> returns the correct response code when the
-    user don't have the proper permission. We show this by asserting that the status code
-    returned is what we would expect (403).
-    """
-    inserted_application_id = await database.execute(
-        query=applications_table.insert(),
-        values=fill_application_data(application_owner_email="owner1@org.com"),
-    )
-    inserted_job_script_id = await database.execute(
-        query=job_scripts_table.insert(),
-        values=fill_job_script_data(application_id=inserted_application_id),
-    )
-    inject_security_header("owner1@org.com", "INVALID_PERMISSION")
-    response = await client.get(f"/jobbergate/job-scripts/{inserted_job_script_id}")
-    assert response.status_code == status.HTTP_403_FORBIDDEN
-
-
-@pytest.mark.asyncio
-@database.transaction(force_rollback=True)
 async def test_get_job_script__no_params(
     client,
-    fill_application_data,
-    fill_all_job_script_data,
+    seed_application_with_scripts,
     inject_security_header,
 ):
     """
@@ -400,33 +344,14 @@ async def test_get_job_script__no_params(
     the request. We show this by asserting that the job_scripts returned in the response are
     only job_scripts owned by the user making the request.
     """
-    inserted_application_id = await database.execute(
-        query=applications_table.insert(),
-        values=fill_application_data(application_owner_email="owner1@org.com"),
+    common = dict(job_script_data_as_string="whatever")
+    await seed_application_with_scripts(
+        [
+            dict(job_script_name="js1", job_script_owner_email="owner1@org.com", **common),
+            dict(job_script_name="js2", job_script_owner_email="owner999@org.com", **common),
+            dict(job_script_name="js3", job_script_owner_email="owner1@org.com", **common),
+        ]
     )
-    await database.execute_many(
-        query=job_scripts_table.insert(),
-        values=fill_all_job_script_data(
-            dict(
-                job_script_name="js1",
-                job_script_owner_email="owner1@org.com",
-                application_id=inserted_application_id,
-            ),
-            dict(
-                job_script_name="js2",
-                job_script_owner_email="owner999@org.com",
-                application_id=inserted_application_id,
-            ),
-            dict(
-                job_script_name="js3",
-                job_script_owner_email="owner1@org.com",
-                application_id=inserted_application_id,
-            ),
-        ),
-    )
-
-    count = await database.fetch_all("SELECT COUNT(*) FROM job_scripts")
-    assert count[0][0] == 3
 
     inject_security_header("owner1@org.com", Permissions.JOB_SCRIPTS_VIEW)
     response = await client.get("/jobbergate/job-scripts/")
@@ -446,42 +371,9 @@ async def test_get_job_script__no_params(
 
 
 @pytest.mark.asyncio
-@database.transaction(force_rollback=True)
-async def test_get_job_scripts__bad_permission(
-    client,
-    fill_application_data,
-    fill_job_script_data,
-    inject_security_header,
-):
-    """
-    Test GET /job-scripts/ returns 403 since the user don't have the proper permission.
-
-    This test proves that GET /job-scripts/ returns the 403 status code when the user making the request
-    don't have the permission to list. We show this by asserting that the response status code is 403.
-    """
-    inserted_application_id = await database.execute(
-        query=applications_table.insert(),
-        values=fill_application_data(application_owner_email="owner1@org.com"),
-    )
-    await database.execute(
-        query=job_scripts_table.insert(),
-        values=fill_job_script_data(application_id=inserted_application_id),
-    )
-
-    count = await database.fetch_all("SELECT COUNT(*) FROM job_scripts")
-    assert count[0][0] == 1
-
-    inject_security_header("owner1@org.com", "INVALID_PERMISSION")
-    response = await client.get("/jobbergate/job-scripts/")
-    assert response.status_code == status.HTTP_403_FORBIDDEN
-
-
-@pytest.mark.asyncio
-@database.transaction(force_rollback=True)
 async def test_get_job_scripts__with_all_param(
     client,
-    fill_application_data,
-    fill_all_job_script_data,
+    seed_application_with_scripts,
     inject_security_header,
 ):
     """
@@ -492,33 +384,14 @@ async def test_get_job_scripts__with_all_param(
     owned by another user. Assert that the response to GET /job-scripts/?all=True includes all three
     job_scripts.
     """
-    inserted_application_id = await database.execute(
-        query=applications_table.insert(),
-        values=fill_application_data(application_owner_email="owner1@org.com"),
+    common = dict(job_script_data_as_string="whatever")
+    await seed_application_with_scripts(
+        [
+            dict(job_script_name="script1", job_script_owner_email="owner1@org.com", **common),
+            dict(job_script_name="script2", job_script_owner_email="owner999@org.com", **common),
+            dict(job_script_name="script3", job_script_owner_email="owner1@org.com", **common),
+        ]
     )
-    await database.execute_many(
-        query=job_scripts_table.insert(),
-        values=fill_all_job_script_data(
-            {
-                "job_script_name": "script1",
-                "job_script_owner_email": "owner1@org.com",
-                "application_id": inserted_application_id,
-            },
-            {
-                "job_script_name": "script2",
-                "job_script_owner_email": "owner999@org.com",
-                "application_id": inserted_application_id,
-            },
-            {
-                "job_script_name": "script3",
-                "job_script_owner_email": "owner1@org.com",
-                "application_id": inserted_application_id,
-            },
-        ),
-    )
-
-    count = await database.fetch_all("SELECT COUNT(*) FROM job_scripts")
-    assert count[0][0] == 3
 
     inject_security_header("owner1@org.com", Permissions.JOB_SCRIPTS_VIEW)
     response = await client.get("/jobbergate/job-scripts/?all=True")
@@ -538,8 +411,9 @@ async def test_get_job_scripts__with_all_param(
 
 
 @pytest.mark.asyncio
-@database.transaction(force_rollback=True)
-async def test_get_job_scripts__with_search_param(client, inject_security_header, fill_application_data):
+async def test_get_job_scripts__with_search_param(
+    client, bulk_insert, inject_security_header, seeded_application
+):
     """
     Test that listing job scripts, when search=<search terms>, returns matches.
 
@@ -548,14 +422,11 @@ async def test_get_job_scripts__with_search_param(client, inject_security_header
 
     Assert that the response to GET /job_scripts?search=<search temrms> includes correct matches.
     """
-    inserted_application_id = await database.execute(
-        query=applications_table.insert(),
-        values=fill_application_data(application_owner_email="owner1@org.com"),
-    )
+    inserted_application_id = seeded_application
     common = dict(job_script_data_as_string="whatever", application_id=inserted_application_id)
-    await database.execute_many(
-        query=job_scripts_table.insert(),
-        values=[
+    await bulk_insert(
+        job_scripts_table,
+        [
             dict(
                 id=1,
                 job_script_name="test name one",
@@ -577,41 +448,27 @@ async def test_get_job_scripts__with_search_param(client, inject_security_header
             ),
         ],
     )
-    count = await database.fetch_all("SELECT COUNT(*) FROM job_scripts")
-    assert count[0][0] == 3
-
     inject_security_header("admin@org.com", Permissions.JOB_SCRIPTS_VIEW)
 
-    response = await client.get("/jobbergate/job-scripts?all=true&search=one")
-    assert response.status_code == status.HTTP_200_OK
-    data = response.json()
-    results = data.get("results")
-    assert [d["id"] for d in results] == [1]
-
-    response = await client.get("/jobbergate/job-scripts?all=true&search=two")
-    assert response.status_code == status.HTTP_200_OK
-    data = response.json()
-    results = data.get("results")
-    assert [d["id"] for d in results] == [2, 22]
-
-    response = await client.get("/jobbergate/job-scripts?all=true&search=long")
-    assert response.status_code == status.HTTP_200_OK
-    data = response.json()
-    results = data.get("results")
-    assert [d["id"] for d in results] == [22]
-
-    response = await client.get("/jobbergate/job-scripts?all=true&search=name+test")
-    assert response.status_code == status.HTTP_200_OK
-    data = response.json()
-    results = data.get("results")
-    assert [d["id"] for d in results] == [1, 2, 22]
+    searches = [
+        ("one", [1]),
+        ("two", [2, 22]),
+        ("long", [22]),
+        ("name+test", [1, 2, 22]),
+    ]
+    responses = await asyncio.gather(
+        *(client.get(f"/jobbergate/job-scripts?all=true&search={terms}") for (terms, _) in searches)
+    )
+    for response, (_, expected_ids) in zip(responses, searches):
+        assert response.status_code == status.HTTP_200_OK
+        results = response.json().get("results")
+        assert [d["id"] for d in results] == expected_ids
 
 
 @pytest.mark.asyncio
-@database.transaction(force_rollback=True)
 async def test_get_job_scripts__with_sort_params(
     client,
-    fill_application_data,
+    seed_application_with_scripts,
     inject_security_header,
 ):
     """
@@ -624,54 +481,32 @@ async def test_get_job_scripts__with_sort_params(
     Assert that the response to GET /job_scripts?sort_field=<field>&sort_ascending=<bool> includes correctly
     sorted job_script.
     """
-    inserted_application_id = await database.execute(
-        query=applications_table.insert(),
-        values=fill_application_data(application_owner_email="admin@org.com"),
-    )
     common = dict(
         job_script_owner_email="admin@org.com",
         job_script_data_as_string="whatever",
-        application_id=inserted_application_id,
     )
-    await database.execute_many(
-        query=job_scripts_table.insert(),
-        values=[
-            dict(
-                job_script_name="Z",
-                **common,
-            ),
-            dict(
-                job_script_name="Y",
-                **common,
-            ),
-            dict(
-                job_script_name="X",
-                **common,
-            ),
+    await seed_application_with_scripts(
+        [
+            dict(job_script_name="Z", **common),
+            dict(job_script_name="Y", **common),
+            dict(job_script_name="X", **common),
         ],
+        owner_email="admin@org.com",
     )
-    count = await database.fetch_all("SELECT COUNT(*) FROM job_scripts")
-    assert count[0][0] == 3
-
     inject_security_header("admin@org.com", Permissions.JOB_SCRIPTS_VIEW)
 
-    response = await client.get("/jobbergate/job-scripts?sort_field=id")
-    assert response.status_code == status.HTTP_200_OK
-    data = response.json()
-    results = data.get("results")
-    assert [d["job_script_name"] for d in results] == ["Z", "Y", "X"]
-
-    response = await client.get("/jobbergate/job-scripts?sort_field=id&sort_ascending=false")
-    assert response.status_code == status.HTTP_200_OK
-    data = response.json()
-    results = data.get("results")
-    assert [d["job_script_name"] for d in results] == ["X", "Y", "Z"]
-
-    response = await client.get("/jobbergate/job-scripts?sort_field=job_script_name")
-    assert response.status_code == status.HTTP_200_OK
-    data = response.json()
-    results = data.get("results")
-    assert [d["job_script_name"] for d in results] == ["X", "Y", "Z"]
+    sorts = [
+        ("sort_field=id", ["Z", "Y", "X"]),
+        ("sort_field=id&sort_ascending=false", ["X", "Y", "Z"]),
+        ("sort_field=job_script_name", ["X", "Y", "Z"]),
+    ]
+    responses = await asyncio.gather(
+        *(client.get(f"/jobbergate/job-scripts?{params}") for (params, _) in sorts)
+    )
+    for response, (_, expected_names) in zip(responses, sorts):
+        assert response.status_code == status.HTTP_200_OK
+        results = response.json().get("results")
+        assert [d["job_script_name"] for d in results] == expected_names
 
     response = await client.get("/jobbergate/job-scripts?all=true&sort_field=job_script_data_as_string")
     assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -679,11 +514,9 @@ async def test_get_job_scripts__with_sort_params(
 
 
 @pytest.mark.asyncio
-@database.transaction(force_rollback=True)
 async def test_get_job_scripts__with_pagination(
     client,
-    fill_application_data,
-    fill_job_script_data,
+    seed_application_with_scripts,
     inject_security_header,
 ):
     """
@@ -692,69 +525,38 @@ async def test_get_job_scripts__with_pagination(
     This test proves that the user making the request can see job_scripts paginated.
     We show this by creating three job_scripts and assert that the response is correctly paginated.
     """
-    inserted_application_id = await database.execute(
-        query=applications_table.insert(),
-        values=fill_application_data(application_owner_email="owner1@org.com"),
-    )
-    await database.execute_many(
-        query=job_scripts_table.insert(),
-        values=[
-            fill_job_script_data(
-                job_script_name=f"script{i}",
-                job_script_owner_email="owner1@org.com",
-                application_id=inserted_application_id,
-            )
-            for i in range(1, 6)
-        ],
-    )
-
-    count = await database.fetch_all("SELECT COUNT(*) FROM job_scripts")
-    assert count[0][0] == 5
+    base = dict(job_script_data_as_string="whatever", job_script_owner_email="owner1@org.com")
+    await seed_application_with_scripts([{**base, "job_script_name": f"script{i}"} for i in range(1, 6)])
 
     inject_security_header("owner1@org.com", Permissions.JOB_SCRIPTS_VIEW)
-    response = await client.get("/jobbergate/job-scripts?start=0&limit=1")
-    assert response.status_code == status.HTTP_200_OK
-
-    data = response.json()
-    results = data.get("results")
-    assert results
-    assert [d["job_script_name"] for d in results] == ["script1"]
-
-    pagination = data.get("pagination")
-    assert pagination == dict(total=5, start=0, limit=1)
-
-    response = await client.get("/jobbergate/job-scripts?start=1&limit=2")
-    assert response.status_code == status.HTTP_200_OK
-
-    data = response.json()
-    results = data.get("results")
-    assert results
-    assert [d["job_script_name"] for d in results] == ["script3", "script4"]
-
-    pagination = data.get("pagination")
-    assert pagination == dict(total=5, start=1, limit=2)
-
-    response = await client.get("/jobbergate/job-scripts?start=2&limit=2")
-    assert response.status_code == status.HTTP_200_OK
 
-    data = response.json()
-    results = data.get("results")
-    assert results
-    assert [d["job_script_name"] for d in results] == ["script5"]
+    pages = [
+        (dict(total=5, start=0, limit=1), ["script1"]),
+        (dict(total=5, start=1, limit=2), ["script3", "script4"]),
+        (dict(total=5, start=2, limit=2), ["script5"]),
+    ]
+    responses = await asyncio.gather(
+        *(
+            client.get(f"/jobbergate/job-scripts?start={page['start']}&limit={page['limit']}")
+            for (page, _) in pages
+        )
+    )
+    for response, (expected_pagination, expected_names) in zip(responses, pages):
+        assert response.status_code == status.HTTP_200_OK
 
-    pagination = data.get("pagination")
-    assert pagination == dict(total=5, start=2, limit=2)
+        data = response.json()
+        results = data.get("results")
+        assert results
+        assert [d["job_script_name"] for d in results] == expected_names
+        assert data.get("pagination") == expected_pagination
 
 
 @pytest.mark.freeze_time
 @pytest.mark.asyncio
-@database.transaction(force_rollback=True)
 async def test_update_job_script(
     client,
-    fill_application_data,
-    fill_job_script_data,
+    seeded_job_script,
     inject_security_header,
-    time_frame,
 ):
     """
     Test update job_script via PUT.
@@ -763,25 +565,17 @@ async def test_update_job_script(
     /job-scripts/<id> endpoint. We show this by assert the response status code to 201, the response data
     corresponds to the updated data, and the data in the database is also updated.
     """
-    inserted_application_id = await database.execute(
-        query=applications_table.insert(),
-        values=fill_application_data(application_owner_email="owner1@org.com"),
-    )
-    inserted_job_script_id = await database.execute(
-        query=job_scripts_table.insert(),
-        values=fill_job_script_data(application_id=inserted_application_id),
-    )
-
     inject_security_header("owner1@org.com", Permissions.JOB_SCRIPTS_EDIT)
-    with time_frame() as window:
-        response = await client.put(
-            f"/jobbergate/job-scripts/{inserted_job_script_id}",
-            json={
-                "job_script_name": "new name",
-                "job_script_description": "new description",
-                "job_script_data_as_string": "new value",
-            },
-        )
+    before = datetime.utcnow().replace(microsecond=0)
+    response = await client.put(
+        f"/jobbergate/job-scripts/{seeded_job_script}",
+        json={
+            "job_script_name": "new name",
+            "job_script_description": "new description",
+            "job_script_data_as_string": "new value",
+        },
+    )
+    after = datetime.utcnow() + timedelta(seconds=1)
 
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
@@ -789,79 +583,24 @@ async def test_update_job_script(
     assert data["job_script_name"] == "new name"
     assert data["job_script_description"] == "new description"
     assert data["job_script_data_as_string"] == "new value"
-    assert data["id"] == inserted_job_script_id
-
-    query = job_scripts_table.select(job_scripts_table.c.id == inserted_job_script_id)
-    job_script = JobScriptResponse.parse_obj(await database.fetch_one(query))
-
-    assert job_script is not None
-    assert job_script.job_script_name == "new name"
-    assert job_script.job_script_description == "new description"
-    assert job_script.job_script_data_as_string == "new value"
-    assert job_script.updated_at in window
-
-
-@pytest.mark.asyncio
-@database.transaction(force_rollback=True)
-async def test_update_job_script_not_found(
-    client,
-    inject_security_header,
-):
-    """
-    Test that it is not possible to update a job_script not found.
-
-    This test proves that it is not possible to update a job_script if it is not found. We show this by
-    asserting that the response status code of the request is 404.
-    """
-    inject_security_header("owner1@org.com", Permissions.JOB_SCRIPTS_EDIT)
-    response = await client.put("/jobbergate/job-scripts/123", json={"job_script_name": "new name"})
-
-    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert data["id"] == seeded_job_script
 
-
-@pytest.mark.asyncio
-@database.transaction(force_rollback=True)
-async def test_update_job_script_bad_permission(
-    client,
-    fill_application_data,
-    fill_job_script_data,
-    inject_security_header,
-):
-    """
-    Test that it is not possible to update a job_script if the user don't have the proper permission.
-
-    This test proves that it is not possible to update a job_script if the user don't have permission. We
-    show this by asserting that the response status code of the request is 403, and that the data stored in
-    the database for the job_script is not updated.
-    """
-    inserted_application_id = await database.execute(
-        query=applications_table.insert(),
-        values=fill_application_data(application_owner_email="owner1@org.com"),
-    )
-    await database.execute(
-        query=job_scripts_table.insert(),
-        values=fill_job_script_data(job_script_name="target-js", application_id=inserted_application_id),
-    )
-
-    inject_security_header("owner1@org.com", "INVALID_PERMISSION")
-    response = await client.put("/jobbergate/job-scripts/1", data={"job_script_name": "new name"})
-
-    assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    query = job_scripts_table.select(job_scripts_table.c.job_script_name == "target-js")
+    query = job_scripts_table.select(job_scripts_table.c.id == seeded_job_script)
     job_script_row = await database.fetch_one(query)
 
     assert job_script_row is not None
-    assert job_script_row["job_script_name"] == "target-js"
+    assert job_script_row["job_script_name"] == "new name"
+    assert job_script_row["job_script_description"] == "new description"
+    assert job_script_row["job_script_data_as_string"] == "new value"
+    assert before <= job_script_row["updated_at"] <= after
 
 
 @pytest.mark.asyncio
-@database.transaction(force_rollback=True)
 async def test_delete_job_script(
     client,
-    fill_application_data,
-    fill_job_script_data,
+    seeded_job_script,
     inject_security_header,
+    row_exists,
 ):
     """
     Test delete job_script via DELETE.
@@ -870,29 +609,15 @@ async def test_delete_job_script(
     endpoint. We show this by asserting that the job_script no longer exists in the database after the
     request is made and the correct status code is returned (204).
     """
-    inserted_application_id = await database.execute(
-        query=applications_table.insert(),
-        values=fill_application_data(),
-    )
-    inserted_job_script_id = await database.execute(
-        query=job_scripts_table.insert(),
-        values=fill_job_script_data(application_id=inserted_application_id),
-    )
-
-    count = await database.fetch_all("SELECT COUNT(*) FROM job_scripts")
-    assert count[0][0] == 1
-
     inject_security_header("owner1@org.com", Permissions.JOB_SCRIPTS_EDIT)
-    response = await client.delete(f"/jobbergate/job-scripts/{inserted_job_script_id}")
+    response = await client.delete(f"/jobbergate/job-scripts/{seeded_job_script}")
 
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
-    count = await database.fetch_all("SELECT COUNT(*) FROM job_scripts")
-    assert count[0][0] == 0
+    assert not await row_exists(job_scripts_table, seeded_job_script)
 
 
 @pytest.mark.asyncio
-@database.transaction(force_rollback=True)
 async def test_delete_job_script_not_found(client, inject_security_header):
     """
     Test that it is not possible to delete a job_script that is not found.
@@ -907,12 +632,11 @@ async def test_delete_job_script_not_found(client, inject_security_header):
 
 
 @pytest.mark.asyncio
-@database.transaction(force_rollback=True)
 async def test_delete_job_script_bad_permission(
     client,
-    fill_application_data,
-    fill_job_script_data,
+    seeded_job_script,
     inject_security_header,
+    row_exists,
 ):
     """
     Test that it is not possible to delete a job_script when the user don't have the permission.
@@ -921,64 +645,39 @@ async def test_delete_job_script_bad_permission(
     We show this by assert that a 403 response status code is returned and the job_script still exists in
     the database after the request.
     """
-    inserted_application_id = await database.execute(
-        query=applications_table.insert(),
-        values=fill_application_data(),
-    )
-    inserted_job_script_id = await database.execute(
-        query=job_scripts_table.insert(),
-        values=fill_job_script_data(application_id=inserted_application_id),
-    )
-
-    count = await database.fetch_all("SELECT COUNT(*) FROM job_scripts")
-    assert count[0][0] == 1
-
     inject_security_header("owner1@org.com", "INVALID_PERMISSION")
-    response = await client.delete(f"/jobbergate/job-scripts/{inserted_job_script_id}")
+    response = await client.delete(f"/jobbergate/job-scripts/{seeded_job_script}")
 
     assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    count = await database.fetch_all("SELECT COUNT(*) FROM job_scripts")
-    assert count[0][0] == 1
+    assert await row_exists(job_scripts_table, seeded_job_script)
 
 
 @pytest.mark.asyncio
-@database.transaction(force_rollback=True)
 async def test_delete_job_script__fk_error(
     client,
-    fill_application_data,
-    fill_job_script_data,
+    seeded_job_script,
     inject_security_header,
 ):
     """
     Test DELETE /job_script/<id> correctly returns a 409 on a foreign-key constraint error.
     """
-    inserted_application_id = await database.execute(
-        query=applications_table.insert(),
-        values=fill_application_data(),
-    )
-    inserted_job_script_id = await database.execute(
-        query=job_scripts_table.insert(),
-        values=fill_job_script_data(application_id=inserted_application_id),
-    )
-
-    count = await database.fetch_all("SELECT COUNT(*) FROM job_scripts")
-    assert count[0][0] == 1
+    import asyncpg
 
     inject_security_header("owner1@org.com", Permissions.JOB_SCRIPTS_EDIT)
     with mock.patch(
-        "jobbergate_api.storage.database.execute",
+        "jobbergate_api.storage.database.fetch_one",
         side_effect=asyncpg.exceptions.ForeignKeyViolationError(
             f"""
             update or delete on table "job_scripts" violates foreign key constraint
             "job_submissions_job_script_id_fkey" on table "job_submissions"
-            DETAIL:  Key (id)=({inserted_job_script_id}) is still referenced from table "job_submissions".
+            DETAIL:  Key (id)=({seeded_job_script}) is still referenced from table "job_submissions".
             """
         ),
     ):
-        response = await client.delete(f"/jobbergate/job-scripts/{inserted_job_script_id}")
+        response = await client.delete(f"/jobbergate/job-scripts/{seeded_job_script}")
     assert response.status_code == status.HTTP_409_CONFLICT
-    error_data = json.loads(response.text)["detail"]
+    error_data = response.json()["detail"]
     assert error_data["message"] == "Delete failed due to foreign-key constraint"
     assert error_data["table"] == "job_submissions"
-    assert error_data["pk_id"] == f"{inserted_job_script_id}"
+    assert error_data["pk_id"] == f"{seeded_job_script}"
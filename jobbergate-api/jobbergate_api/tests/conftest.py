@@ -5,12 +5,14 @@ Configuration of pytest.
 import contextlib
 import dataclasses
 import datetime
+import os
 import random
 import string
 import typing
 
 import pytest
 import sqlalchemy
+import uvloop
 from asgi_lifespan import LifespanManager
 from httpx import AsyncClient
 
@@ -25,12 +27,46 @@ from jobbergate_api.storage import build_db_url, database
 # Charset for producing random strings
 CHARSET = string.ascii_letters + string.digits + string.punctuation
 
+# Session-wide memo of signed test tokens keyed by (email, permissions, cluster_id). The armasec
+# pytest extension signs with a fixed key, so an identical token stays valid for the whole run and
+# repeated tests skip the RS256 signing work.
+_token_cache: typing.Dict[typing.Tuple, str] = {}
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """
+    Provide a session-wide uvloop event loop for the async tests.
+
+    uvloop dispatches the asyncpg and httpx socket traffic faster than the default selector loop.
+    """
+    loop = uvloop.new_event_loop()
+    yield loop
+    loop.close()
+
 
 @pytest.fixture(autouse=True, scope="session")
 async def enforce_empty_database():
     """
     Make sure our database is empty at the end of each test.
-    """
+
+    Under pytest-xdist, first make sure this worker's database (named by the suffixed
+    ``TEST_DATABASE_NAME`` set in the tests package ``__init__``) actually exists.
+    """
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        maintenance_engine = sqlalchemy.create_engine(
+            build_db_url().rsplit("/", 1)[0] + "/postgres",
+            isolation_level="AUTOCOMMIT",
+        )
+        with maintenance_engine.connect() as connection:
+            exists = connection.execute(
+                sqlalchemy.text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                {"name": settings.TEST_DATABASE_NAME},
+            ).scalar()
+            if not exists:
+                connection.execute(sqlalchemy.text(f'CREATE DATABASE "{settings.TEST_DATABASE_NAME}"'))
+        maintenance_engine.dispose()
+
     engine = sqlalchemy.create_engine(build_db_url())
     metadata.create_all(engine)
     yield
@@ -64,15 +100,28 @@ def enforce_mocked_oidc_provider(mock_openid_server):
     yield
 
 
-@pytest.fixture
-async def client():
+@pytest.fixture(scope="session")
+async def backend_client():
     """
-    Provide a client that can issue fake requests against fastapi endpoint functions in the backend.
+    Provide the session-wide client used to issue fake requests against the backend.
+
+    Building the ASGI transport once per session is cheaper than rebuilding it for every test.
     """
     async with AsyncClient(app=app, base_url="http://test") as client:
         yield client
 
 
+@pytest.fixture
+async def client(backend_client):
+    """
+    Provide a client that can issue fake requests against fastapi endpoint functions in the backend.
+
+    Reuses the session-wide transport but strips any security header left over from a previous test.
+    """
+    backend_client.headers.pop("Authorization", None)
+    return backend_client
+
+
 @pytest.fixture
 async def inject_security_header(client, build_rs256_token):
     """
@@ -88,11 +137,14 @@ async def inject_security_header(client, build_rs256_token):
         *permissions: typing.List[str],
         cluster_id: typing.Optional[str] = None,
     ):
-        claim_overrides = {
-            settings.IDENTITY_CLAIMS_KEY: {"user_email": owner_email, "cluster_id": cluster_id},
-            "permissions": permissions,
-        }
-        token = build_rs256_token(claim_overrides=claim_overrides)
+        cache_key = (owner_email, permissions, cluster_id)
+        token = _token_cache.get(cache_key)
+        if token is None:
+            claim_overrides = {
+                settings.IDENTITY_CLAIMS_KEY: {"user_email": owner_email, "cluster_id": cluster_id},
+                "permissions": permissions,
+            }
+            token = _token_cache[cache_key] = build_rs256_token(claim_overrides=claim_overrides)
         client.headers.update({"Authorization": f"Bearer {token}"})
 
     return _helper
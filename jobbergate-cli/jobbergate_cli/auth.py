@@ -154,6 +154,7 @@ def init_persona(ctx: JobbergateContext, token_set: Optional[TokenSet] = None):
 
     Returns the persona.
     """
+    tokens_need_caching = token_set is not None
     if token_set is None:
         token_set = load_tokens_from_cache()
 
@@ -172,10 +173,14 @@ def init_persona(ctx: JobbergateContext, token_set: Optional[TokenSet] = None):
         logger.debug("The access token is expired. Attempting to refresh token")
         refresh_access_token(ctx, token_set)
         identity_data = validate_token_and_extract_identity(token_set)
+        tokens_need_caching = True
 
     logger.debug(f"Persona created with identity data: {identity_data}")
 
-    save_tokens_to_cache(token_set)
+    # Tokens that came straight out of the cache and were not refreshed are already on disk, so only
+    # write them back when they are new or changed.
+    if tokens_need_caching:
+        save_tokens_to_cache(token_set)
 
     return Persona(
         token_set=token_set,
@@ -61,17 +61,20 @@ class Settings(BaseSettings):
         Compute settings values that are based on other settings values.
         """
         cache_dir = values["JOBBERGATE_CACHE_DIR"]
-        cache_dir.mkdir(exist_ok=True, parents=True)
+        if not cache_dir.is_dir():
+            cache_dir.mkdir(exist_ok=True, parents=True)
 
         values["JOBBERGATE_APPLICATION_MODULE_PATH"] = cache_dir / constants.JOBBERGATE_APPLICATION_MODULE_FILE_NAME
         values["JOBBERGATE_APPLICATION_CONFIG_PATH"] = cache_dir / constants.JOBBERGATE_APPLICATION_CONFIG_FILE_NAME
 
         log_dir = cache_dir / "logs"
-        log_dir.mkdir(exist_ok=True, parents=True)
+        if not log_dir.is_dir():
+            log_dir.mkdir(exist_ok=True, parents=True)
         values["JOBBERGATE_LOG_PATH"] = log_dir / "jobbergate-cli.log"
 
         token_dir = cache_dir / "token"
-        token_dir.mkdir(exist_ok=True, parents=True)
+        if not token_dir.is_dir():
+            token_dir.mkdir(exist_ok=True, parents=True)
         values["JOBBERGATE_USER_TOKEN_DIR"] = token_dir
         values["JOBBERGATE_API_ACCESS_TOKEN_PATH"] = token_dir / "access.token"
         values["JOBBERGATE_API_REFRESH_TOKEN_PATH"] = token_dir / "refresh.token"
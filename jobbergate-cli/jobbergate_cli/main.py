@@ -69,9 +69,14 @@ def main(
     init_sentry()
     persona = None
 
+    # http2 lets the several requests a single invocation makes (auth refresh, data fetches) share one
+    # multiplexed connection, and the keepalive limit makes sure the connection is actually reused
+    # instead of paying a fresh TCP + TLS handshake per call.
     client = httpx.Client(
         base_url=f"https://{settings.AUTH0_LOGIN_DOMAIN}",
         headers={"content-type": "application/x-www-form-urlencoded"},
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=10),
     )
     context = JobbergateContext(persona=None, client=client)
 
@@ -80,6 +85,8 @@ def main(
         context.client = httpx.Client(
             base_url=settings.JOBBERGATE_API_ENDPOINT,
             headers=dict(Authorization=f"Bearer {persona.token_set.access_token}"),
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10),
         )
         context.persona = persona
         context.full_output = full
@@ -126,7 +126,8 @@ def render_list_results(
         if ctx.full_output or hidden_fields is None:
             filtered_results = envelope.results
         else:
-            filtered_results = [{k: v for (k, v) in d.items() if k not in hidden_fields} for d in envelope.results]
+            hidden = set(hidden_fields)
+            filtered_results = [{k: v for (k, v) in d.items() if k not in hidden} for d in envelope.results]
         first_row = filtered_results[0]
 
         table = Table(title=title, caption=f"Total items: {envelope.pagination.total}")
@@ -136,7 +137,7 @@ def render_list_results(
             table.add_column(key, **style_mapper.map_style(key))
 
         for row in filtered_results:
-            table.add_row(*[str(v) for v in row.values()])
+            table.add_row(*map(str, row.values()))
 
         console = Console()
         console.print()
@@ -1,5 +1,6 @@
 """ApplicationBase."""
 
+import os
 import pathlib
 from typing import Any, Dict, List
 
@@ -25,11 +26,15 @@ class JobbergateApplicationBase:
         """
         Finds templates a given application path.
         """
+        # os.walk rides on scandir, so file-vs-directory comes from the directory entries themselves
+        # instead of the stat call per path that glob("**/*") + is_file() would pay. Walking a missing
+        # templates directory simply yields nothing, which also covers the old exists() check.
         template_root_path = application_path / "templates"
-        if template_root_path.exists():
-            return sorted(p.relative_to(application_path) for p in template_root_path.glob("**/*") if p.is_file())
-        else:
-            return list()
+        found = []
+        for (dir_path, _, file_names) in os.walk(template_root_path):
+            rel_dir = pathlib.Path(dir_path).relative_to(application_path)
+            found.extend(rel_dir / file_name for file_name in file_names)
+        return sorted(found)
 
     def get_template_files(self) -> List[pathlib.Path]:
         template_file_paths = self.find_templates(pathlib.Path.cwd())
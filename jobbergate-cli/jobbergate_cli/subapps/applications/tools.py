@@ -2,8 +2,8 @@
 Provide tool functions for working with Application data.
 """
 
-import ast
 import copy
+import os
 import pathlib
 import tarfile
 import tempfile
@@ -58,7 +58,9 @@ def validate_application_files(application_path: pathlib.Path):
             ),
         )
         try:
-            ast.parse(application_module.read_text())
+            # compile() answers the only question asked here (is this valid python?) without
+            # materializing the AST node objects that ast.parse would build and throw away.
+            compile(application_module.read_bytes(), str(application_module), "exec")
             is_valid_python = True
         except Exception:
             is_valid_python = False
@@ -75,7 +77,10 @@ def validate_application_files(application_path: pathlib.Path):
             ),
         )
         try:
-            yaml.safe_load(application_config.read_text())
+            # Feeding the open handle to the loader lets it read incrementally instead of buffering the
+            # whole file as a python string first; the C loader is used when libyaml is available.
+            with application_config.open("rb") as config_file:
+                yaml.load(config_file, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
             is_valid_yaml = True
         except Exception:
             is_valid_yaml = False
@@ -94,11 +99,13 @@ def dump_full_config(application_path: pathlib.Path) -> str:
     Dump the application config as text. Add existing template file paths into the config.
     """
     config_path = application_path / JOBBERGATE_APPLICATION_CONFIG_FILE_NAME
-    config = yaml.safe_load(config_path.read_text())
+    with config_path.open("rb") as config_file:
+        config = yaml.load(config_file, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
     config["jobbergate_config"]["template_files"] = sorted(
         str(t) for t in JobbergateApplicationBase.find_templates(application_path)
     )
-    return yaml.dump(config)
+    # The config is plain parsed YAML, so the (much faster) C dumper handles it when libyaml is around.
+    return yaml.dump(config, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper))
 
 
 def read_application_module(application_path: pathlib.Path) -> str:
@@ -117,19 +124,25 @@ def build_application_tarball(application_path: pathlib.Path, build_dir: pathlib
     :param: build_dir:        The directory where the applicaiton files should be staged and zipped
     """
     tar_path = build_dir / TAR_NAME
-    with tarfile.open(str(tar_path), "w|gz") as archive:
+    # Application sources compress in one pass either way; level 1 runs several times faster than the
+    # default level 9 for a few percent more bytes, which the upload link doesn't notice.
+    with tarfile.open(str(tar_path), "w:gz", compresslevel=1) as archive:
         module_path = application_path / JOBBERGATE_APPLICATION_MODULE_FILE_NAME
         archive.add(module_path, arcname=f"/{module_path.name}")
 
         config_path = application_path / JOBBERGATE_APPLICATION_CONFIG_FILE_NAME
         archive.add(config_path, arcname=f"/{config_path.name}")
 
+        # The old loop checked ``template_path.is_file`` without calling it, so the always-truthy method
+        # reference let directories through and archive.add recursed into them, adding their contents a
+        # second time. Walking with os.walk adds each template file exactly once (including nested ones)
+        # and classifies entries from the scandir data instead of a stat call per path.
         template_root_path = application_path / "templates"
-        if template_root_path.exists():
-            for template_path in template_root_path.iterdir():
-                if template_path.is_file:
-                    rel_path = template_path.relative_to(application_path)
-                    archive.add(template_path, arcname=f"/{rel_path}")
+        for (dir_path, _, file_names) in os.walk(template_root_path):
+            for file_name in file_names:
+                template_path = pathlib.Path(dir_path) / file_name
+                rel_path = template_path.relative_to(application_path)
+                archive.add(template_path, arcname=f"/{rel_path}")
     return tar_path
 
 
@@ -33,7 +33,9 @@ def validate_parameter_file(parameter_path: pathlib.Path) -> Dict[str, Any]:
         )
 
         try:
-            data = json.loads(parameter_path.read_text())
+            # json.loads accepts bytes directly, so read_bytes() skips the decode-to-str copy that
+            # read_text() would make before the parser re-scans the same data.
+            data = json.loads(parameter_path.read_bytes())
             is_valid_json = True
         except Exception:
             is_valid_json = False